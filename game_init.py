@@ -24,8 +24,10 @@ RuleScreen
 StartScreen
 
 Functions:
+load_font
 load_image
 load_sound
+preload_images
 """
 
 __author__ = "Kenneth Doan"
@@ -33,26 +35,76 @@ __email__ = "snarbolax@csu.fullerton.edu"
 __version__ = "0.9"
 __license__ = "LGPL 2.1"
 
+import bisect
+import concurrent.futures
 import datetime
+import functools
 import json
 import sys
 import os
 import pygame
 import objects
 
+# Label of each rank displayed on the leaderboard, highest first.
+# The leaderboard keeps exactly one entry per label.
+_RANK_LABELS = ("1st Place", "2nd Place", "3rd Place", "4th Place",
+                "5th Place", "6th Place", "7th Place", "8th Place",
+                "9th Place", "10th Place")
 
-class _Scene(pygame.Surface):
-    """A subclass of Pygame's Surface object to subclass from.
+# Keys of the leaderboard.json entries from before it became a list,
+# highest first.
+_OLD_RANK_KEYS = ("First Place", "Second Place", "Third Place",
+                  "Fourth Place", "Fifth Place", "Sixth Place",
+                  "Seventh Place", "Eighth Place", "Ninth Place",
+                  "Tenth Place")
+
+# (header text, x offset) and (dictionary key, x offset) of each
+# leaderboard column, relative to the center of the leaderboard box.
+_COL_HEADERS = (("Score", -40),
+                ("Lifetime", 40),
+                ("Date", 150))
+_COL_OFFSETS = (("Score", -40),
+                ("Time Played (in seconds)", 40),
+                ("Date", 148))
+
+# (label, y offset) of each leaderboard row, relative to the center
+# of the leaderboard box. Rows start under the headers, 26 pixels apart.
+_LEADERBOARD_LAYOUT = tuple((label, -107 + 26*i)
+                            for i, label in enumerate(_RANK_LABELS))
+
+# Rendered text surfaces, keyed by font, text, and colors.
+_render_cache = {}
+
+# Whole screens that never change, keyed by (name, size).
+_scene_cache = {}
+
+# load_image() arguments of every image the scenes use, preloaded
+# once the display mode is set. The objects preload their own.
+_IMAGE_MANIFEST = (("snake.png", 0, (110, 110)),
+                   ("apple.png", 0, (110, 110)),
+                   ("snake.png", 0, (300, 300)))
+
+# Runs the game over file writes off of the main thread.
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+# The display surface shared by every scene of the same resolution.
+_display = None
+
+
+class _Scene:
+    """A base class for the game's scenes to subclass from.
 
     The Scene class is setup so that future Scene
     subclasses have a default caption, framerate cap,
     resolution, black background, and initialized
     Pygame clock.
+
+    Scenes draw onto the display surface and their
+    own background surface, not onto themselves.
     """
 
     def __init__(self, caption="Insert Caption Here",
                  framerate_cap=60, size=(640, 640)):
-        super().__init__(size)
         self._framerate_cap = framerate_cap
         # To be used as self.clock.tick(self.framerate_cap)
         self._clock = pygame.time.Clock()
@@ -60,20 +112,23 @@ class _Scene(pygame.Surface):
         self._caption = caption
 
         self._resolution = size
-        self._screen = pygame.display.set_mode(self._resolution)
+        global _display
+        if _display is None or _display.get_size() != tuple(size):
+            _display = pygame.display.set_mode(self._resolution)
+            pygame.display.set_allow_screensaver(True)
+            preload_images(_IMAGE_MANIFEST)
+            objects.preload_assets()
+        self._screen = _display
 
-        if not pygame.display.get_init():
-            pygame.display.init()
         pygame.display.set_caption(self._caption)
-        pygame.display.set_allow_screensaver(True)
 
         self._active = True
 
         self._background = pygame.Surface(self._screen.get_size())
         self._background.fill((0, 0, 0))
         self._background = self._background.convert()
+        # Shown by the subclass's first display update.
         self._screen.blit(self._background, (0, 0))
-        pygame.display.update()
 
 
 class MainGame(_Scene):
@@ -103,66 +158,109 @@ class MainGame(_Scene):
         super().__init__(caption, framerate_cap, size)
         self._dt = 0
         self._add_time_score = pygame.USEREVENT + 1
-        pygame.time.set_timer(self._add_time_score, 3*1000)
 
         self._snake = objects.Snake()
-        self._apple = objects.Apple()
+        self._apple = objects.Apple(self._snake)
         self._scores = objects.ScoreText(self._screen, self._background)
+        # Later frames only update the cells that change.
+        pygame.display.update()
 
         self._snake_appr = pygame.sprite.RenderUpdates(self._snake)
         self._food_appr = pygame.sprite.RenderUpdates(self._apple)
-        self._body_group = pygame.sprite.RenderUpdates(self._snake.new_body)
+
+        self._key_dirs = {
+            pygame.K_w: objects.Dir.UP,
+            pygame.K_UP: objects.Dir.UP,
+            pygame.K_a: objects.Dir.LEFT,
+            pygame.K_LEFT: objects.Dir.LEFT,
+            pygame.K_s: objects.Dir.DOWN,
+            pygame.K_DOWN: objects.Dir.DOWN,
+            pygame.K_d: objects.Dir.RIGHT,
+            pygame.K_RIGHT: objects.Dir.RIGHT
+        }
+
+        # Keep events the game loop ignores off the queue.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN,
+                                  self._add_time_score])
 
         self._time_played = 0
 
-        self._session_info = {
-            "Date": datetime.date.today().strftime("%Y/%m/%d"),
-            "Time Played (in seconds)": int(self._time_played),
-            "Score": 0
-        }
+        # Bound once so the frame loop doesn't re-resolve them every frame.
+        snake = self._snake
+        apple = self._apple
+        scores = self._scores
+        screen = self._screen
+        background = self._background
+        snake_appr = self._snake_appr
+        food_appr = self._food_appr
+        clock = self._clock
+        framerate_cap = self._framerate_cap
+        key_dirs = self._key_dirs
+        move = snake.move
+        add_time_score = self._add_time_score
+        alive = snake.alive
+        event_get = pygame.event.get
+        quit_type = pygame.QUIT
+        keydown_type = pygame.KEYDOWN
+        escape_key = pygame.K_ESCAPE
+
+        # Start timing here, so the setup above isn't counted as play
+        # time and the score timer doesn't fire early.
+        clock.tick()
+        pygame.time.set_timer(add_time_score, 3*1000)
 
         while self._active:
-            if not self._snake.alive():
-                self._session_info[
-                    "Time Played (in seconds)"] = int(self._time_played)
-                self._session_info["Score"] = self._scores.score
-
-                _json_update(self._session_info)
-                _game_over(self._screen, self._background)
-                _leaderboard(self._screen)
+            if not alive():
+                session_info = {
+                    "Date": datetime.date.today().strftime("%Y/%m/%d"),
+                    "Time Played (in seconds)": int(self._time_played),
+                    "Score": scores.score
+                }
+
+                # The JSON files are written while the player is
+                # looking at the game over screen.
+                board = _IO_POOL.submit(_json_update, session_info)
+                _game_over(screen, background)
+                _leaderboard(screen, board.result())
                 self._active = False
+            else:
+                # Erase last frame's sprites before they move.
+                snake.clear_body(screen, background)
+                food_appr.clear(screen, background)
+                snake_appr.clear(screen, background)
+
+                # Every change this frame is flushed with one update.
+                dirty = []
+                if apple.alive():
+                    apple.update(snake, screen, background, scores, dirty)
+                apple.update_spawn_timer(self._dt, snake, food_appr)
+
+                # key inputs
+                for event in event_get():
+                    if (event.type == quit_type
+                        or (event.type == keydown_type
+                            and event.key == escape_key)):
+                        sys.exit()
+                    elif event.type == keydown_type:
+                        direction = key_dirs.get(event.key)
+                        if direction is not None:
+                            move(direction)
+                    elif event.type == add_time_score:
+                        scores.update(screen, background, dirty, 5)
 
-            self._apple._spawn_timer -= self._dt
+                snake_appr.update()
 
-            self._apple.update(self._snake, self._body_group, self._food_appr,
-                               self._screen, self._background, self._scores)
+                # Only the cells the sprites left or moved onto are flushed.
+                dirty += snake.draw_body(screen, dirty)
+                dirty += food_appr.draw(screen)
+                dirty += snake_appr.draw(screen)
+                pygame.display.update(dirty)
 
-            # key inputs
-            for event in pygame.event.get():
-                if (event.type == pygame.QUIT
-                    or (event.type == pygame.KEYDOWN
-                        and event.key == pygame.K_ESCAPE)):
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_w or event.key == pygame.K_UP:
-                        self._snake.moveup()
-                    elif event.key == pygame.K_a or event.key == pygame.K_LEFT:
-                        self._snake.moveleft()
-                    elif event.key == pygame.K_s or event.key == pygame.K_DOWN:
-                        self._snake.movedown()
-                    elif (event.key == pygame.K_RIGHT
-                          or event.key == pygame.K_d):
-                        self._snake.moveright()
-                elif event.type == self._add_time_score:
-                    if self._snake.alive():
-                        self._scores.update(self._screen, self._background, 5)
-
-            self._snake_appr.update(self._body_group,
-                                    self._snake_appr, self._screen,
-                                    self._background)
-            self._dt = self._clock.tick(self._framerate_cap) / 1000
-            if self._snake.alive():
-                self._time_played += self._dt
+                self._dt = clock.tick(framerate_cap) / 1000
+                # The snake may have died during its update this frame.
+                if alive():
+                    self._time_played += self._dt
 
 
 def _json_update(dict_obj):
@@ -175,8 +273,9 @@ def _json_update(dict_obj):
 
     If the player performs well enough, the function will
     also update a 'leaderboard.json' file with the details
-    of the player's session by replacing the values of a 'rank'
-    (e.g. 'Tenth Place', 'Eighth Place', .etc) dictionary key.
+    of the player's session by inserting them into the list
+    of entries (sorted by descending score) and dropping
+    the entry that falls off the bottom of the board.
 
     It is only meant to be called upon by the
     MainGame class.
@@ -187,37 +286,60 @@ def _json_update(dict_obj):
                dump into a JSON object.
                The JSON object will be written into a
                'last_session_info.json' file.
+
+    Return:
+    the (possibly updated) list of leaderboard entries.
     """
-    json_session = json.dumps(dict_obj, indent=3)
+    # Without indent, json.dumps uses its C encoder.
+    json_session = json.dumps(dict_obj, separators=(",", ":"))
     board_update = False
 
-    with open("last_session_info.json", "w") as outfile:
-        outfile.write(json_session)
-        outfile.close()
-
-    with open('leaderboard.json', 'r') as openfile:
-        input_dictionary = json.load(openfile)
-        for place in input_dictionary:
-            player_val = dict_obj["Score"]
-            board_val = input_dictionary[place]["Score"]
-            if player_val > board_val:
-                input_dictionary[place]["Date"] = dict_obj["Date"]
-                input_dictionary[
-                    place]["Time Played (in seconds)"] = dict_obj[
-                        "Time Played (in seconds)"]
-                input_dictionary[place]["Score"] = dict_obj["Score"]
-                board_update = True
-                break
-        openfile.close()
-
-    if board_update:
-        with open("leaderboard.json", "w") as outfile:
-            json_input = json.dumps(input_dictionary, indent=10)
-            outfile.write(json_input)
-            outfile.close()
-
-
-def _leaderboard(scene_screen):
+    with open("last_session_info.json", "wb") as outfile:
+        outfile.write(json_session.encode())
+
+    # The leaderboard is read and, if needed, rewritten through one handle.
+    with open('leaderboard.json', 'r+', encoding="utf-8") as openfile:
+        board = _load_board(openfile)
+        # Negated so the descending board is ascending for bisect;
+        # ties go after the existing entries.
+        scores = [-entry["Score"] for entry in board]
+        place = bisect.bisect_right(scores, -dict_obj["Score"])
+        if place < len(_RANK_LABELS):
+            board.insert(place, {
+                "Date": dict_obj["Date"],
+                "Time Played (in seconds)": dict_obj[
+                    "Time Played (in seconds)"],
+                "Score": dict_obj["Score"]
+            })
+            del board[len(_RANK_LABELS):]
+            board_update = True
+
+        if board_update:
+            openfile.seek(0)
+            openfile.truncate()
+            openfile.write(json.dumps(board, separators=(",", ":")))
+    return board
+
+
+def _load_board(openfile):
+    """Load the list of leaderboard entries from an open file.
+
+    A leaderboard.json saved in the old format, a dictionary
+    keyed by _OLD_RANK_KEYS, is converted to the list.
+
+    Keyword argument:
+    openfile - the opened 'leaderboard.json' file.
+
+    Return:
+    the list of leaderboard entries, sorted by descending score.
+    """
+    board = json.load(openfile)
+    if isinstance(board, dict):
+        board = [board[key] for key in _OLD_RANK_KEYS]
+    return board
+
+
+def _leaderboard(scene_screen, board=None):
     """Display the leaderboard of the game to the player.
 
     It loads the top 10 scores from a 'leaderboard.json'
@@ -234,506 +356,208 @@ def _leaderboard(scene_screen):
     Keyword arguments:
     scene_screen - the display surface that the function
                    renders text onto.
-    """
-    background = pygame.Surface(scene_screen.get_size())
-    background.fill((220, 220, 220))
-    background = background.convert()
 
-    header_font = pygame.font.Font(None, 86)
-    text_font = pygame.font.Font(None, 28)
-    prompt_font = pygame.font.Font(None, 36)
+    Optional argument:
+    board - the list of leaderboard entries to display, as
+            returned by _json_update(). If not given, the
+            entries are loaded from 'leaderboard.json'.
+    """
+    # Text is rendered over the same grey, so no per-text erase is needed.
+    scene_screen.fill((220, 220, 220))
 
-    prompt_font.set_underline(True)
+    header_font = load_font(86)
+    text_font = load_font(28)
+    prompt_font = load_font(36, underline=True)
 
     box_rect = scene_screen.get_rect()
     box_rect.size = (box_rect.width*0.65, box_rect.height*0.65)
     box_rect.center = scene_screen.get_rect().center
 
-    header = header_font.render("Leaderboard", 1, (0, 0, 0),
-                                (220, 220, 220)).convert()
-    header.set_colorkey((220, 220, 220))
+    header = _render(header_font, "Leaderboard")
     header_pos = header.get_rect(midtop=box_rect.midtop)
-    scene_screen.blit(background, header_pos)
     scene_screen.blit(header, header_pos)
 
+    # Each label is centered on the box's center plus its offsets.
+    center_x, center_y = box_rect.center
+
     # Place, Score, Played, Date
-    display_text = text_font.render("Score", 1, (0, 0, 0),
-                                    (220, 220, 220)).convert()
-    display_text.set_colorkey((220, 220, 220))
-    display_text_pos = display_text.get_rect(center=box_rect.center)
-    display_text_pos.y -= 137
-    display_text_pos.x -= 40
-    scene_screen.blit(background, display_text_pos)
-    scene_screen.blit(display_text, display_text_pos)
-
-    display_text = text_font.render("Lifetime", 1, (0, 0, 0),
-                                    (220, 220, 220)).convert()
-    display_text_pos = display_text.get_rect(center=box_rect.center)
-    display_text_pos.y -= 137
-    display_text_pos.x += 40
-    scene_screen.blit(background, display_text_pos)
-    scene_screen.blit(display_text, display_text_pos)
-
-    display_text = text_font.render("Date", 1, (0, 0, 0),
-                                    (220, 220, 220)).convert()
-    display_text_pos = display_text.get_rect(center=box_rect.center)
-    display_text_pos.y -= 137
-    display_text_pos.x += 150
-    scene_screen.blit(background, display_text_pos)
-    scene_screen.blit(display_text, display_text_pos)
-    with open('leaderboard.json', 'r') as openfile:
-        input_dictionary = json.load(openfile)
-
-        display_text = text_font.render("1st Place", 1, (0, 0, 0),
-                                        (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(center=box_rect.center)
-        display_text_pos.y -= 107
-        display_text_pos.x -= 150
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(input_dictionary["First Place"]["Score"]), 1,
-            (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(center=box_rect.center)
-        display_text_pos.y -= 107
-        display_text_pos.x -= 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["First Place"]["Time Played (in seconds)"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(center=box_rect.center)
-        display_text_pos.y -= 107
-        display_text_pos.x += 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["First Place"]["Date"]), 1,
-            (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(center=box_rect.center)
-        display_text_pos.y -= 107
-        display_text_pos.x += 148
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render("2nd Place", 1, (0, 0, 0),
-                                        (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 81
-        display_text_pos.x -= 150
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Second Place"]["Score"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 81
-        display_text_pos.x -= 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Second Place"]["Time Played (in seconds)"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 81
-        display_text_pos.x += 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Second Place"]["Date"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 81
-        display_text_pos.x += 148
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "3rd Place", 1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 55
-        display_text_pos.x -= 150
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Third Place"]["Score"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 55
-        display_text_pos.x -= 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Third Place"]["Time Played (in seconds)"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 55
-        display_text_pos.x += 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Third Place"]["Date"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 55
-        display_text_pos.x += 148
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "4th Place", 1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 29
-        display_text_pos.x -= 150
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Fourth Place"]["Score"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 29
-        display_text_pos.x -= 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Fourth Place"]["Time Played (in seconds)"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 29
-        display_text_pos.x += 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Fourth Place"]["Date"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 29
-        display_text_pos.x += 148
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "5th Place", 1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 3
-        display_text_pos.x -= 150
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Fifth Place"]["Score"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 3
-        display_text_pos.x -= 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Fifth Place"]["Time Played (in seconds)"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 3
-        display_text_pos.x += 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Fifth Place"]["Date"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y -= 3
-        display_text_pos.x += 148
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "6th Place", 1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(center=box_rect.center)
-        display_text_pos.y += 23
-        display_text_pos.x -= 150
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Sixth Place"]["Score"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y += 23
-        display_text_pos.x -= 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Sixth Place"]["Time Played (in seconds)"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y += 23
-        display_text_pos.x += 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Sixth Place"]["Date"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y += 23
-        display_text_pos.x += 148
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "7th Place", 1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(center=box_rect.center)
-        display_text_pos.y += 49
-        display_text_pos.x -= 150
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Seventh Place"]["Score"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y += 49
-        display_text_pos.x -= 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Seventh Place"]["Time Played (in seconds)"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y += 49
-        display_text_pos.x += 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Seventh Place"]["Date"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y += 49
-        display_text_pos.x += 148
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "8th Place", 1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(center=box_rect.center)
-        display_text_pos.y += 75
-        display_text_pos.x -= 150
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Eighth Place"]["Score"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y += 75
-        display_text_pos.x -= 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Eighth Place"]["Time Played (in seconds)"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y += 75
-        display_text_pos.x += 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Eighth Place"]["Date"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y += 75
-        display_text_pos.x += 148
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "9th Place", 1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(center=box_rect.center)
-        display_text_pos.y += 101
-        display_text_pos.x -= 150
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Ninth Place"]["Score"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y += 101
-        display_text_pos.x -= 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Ninth Place"]["Time Played (in seconds)"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y += 101
-        display_text_pos.x += 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(input_dictionary["Ninth Place"]["Date"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y += 101
-        display_text_pos.x += 148
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "10th Place", 1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(center=box_rect.center)
-        display_text_pos.y += 127
-        display_text_pos.x -= 150
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Tenth Place"]["Score"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y += 127
-        display_text_pos.x -= 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(
-                input_dictionary["Tenth Place"]["Time Played (in seconds)"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y += 127
-        display_text_pos.x += 40
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-        display_text = text_font.render(
-            "{0}".format(input_dictionary["Tenth Place"]["Date"]),
-            1, (0, 0, 0), (220, 220, 220)).convert()
-        display_text_pos = display_text.get_rect(
-            center=box_rect.center)
-        display_text_pos.y += 127
-        display_text_pos.x += 148
-        scene_screen.blit(background, display_text_pos)
-        scene_screen.blit(display_text, display_text_pos)
-
-    prompt = prompt_font.render(
-        "Press Any Key to Continue", 1, (0, 0, 0),
-        (220, 220, 220)).convert()
-    prompt.set_colorkey((220, 220, 220))
+    for label, x_offset in _COL_HEADERS:
+        display_text = _render(text_font, label)
+        width, height = display_text.get_size()
+        scene_screen.blit(display_text,
+                          (center_x - width//2 + x_offset,
+                           center_y - height//2 - 137))
+
+    if board is None:
+        with open('leaderboard.json', 'r') as openfile:
+            board = _load_board(openfile)
+
+    for (rank_label, y_offset), entry in zip(_LEADERBOARD_LAYOUT, board):
+        display_text = _render(text_font, rank_label)
+        width, height = display_text.get_size()
+        scene_screen.blit(display_text,
+                          (center_x - width//2 - 150,
+                           center_y - height//2 + y_offset))
+
+        for col_key, x_offset in _COL_OFFSETS:
+            display_text = _render(
+                text_font, "{0}".format(entry[col_key]))
+            width, height = display_text.get_size()
+            scene_screen.blit(display_text,
+                              (center_x - width//2 + x_offset,
+                               center_y - height//2 + y_offset))
+
+    prompt = _render(prompt_font, "Press Any Key to Continue")
     prompt_pos = prompt.get_rect(midbottom=box_rect.midbottom)
     prompt_pos.y -= 10
-    scene_screen.blit(background, prompt_pos)
     scene_screen.blit(prompt, prompt_pos)
 
-    pygame.display.update((box_rect, header_pos, prompt_pos))
+    pygame.display.flip()
 
-    while header_pos.y <= 382:
-        for event in pygame.event.get():
-            if (event.type == pygame.QUIT
-                or (event.type == pygame.KEYDOWN
-                    and event.key == pygame.K_ESCAPE)):
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                background.fill((0, 0, 0))
-                scene_screen.blit(background, (0, 0))
-
-                prompt = prompt_font.render(
-                    "Press Any Key to Try Again", 1,
-                    (255, 255, 255), (0, 0, 0)).convert()
-                prompt.set_colorkey((0, 0, 0))
-                prompt_pos = prompt.get_rect(
-                    center=scene_screen.get_rect().center)
-                scene_screen.blit(background, prompt_pos)
-                scene_screen.blit(prompt, prompt_pos)
-
-                display_text = text_font.render(
-                    "Press the Escape Key to Exit the Game", 1,
-                    (255, 255, 255), (0, 0, 0)).convert()
-                display_text.set_colorkey((0, 0, 0))
-                display_text_pos = display_text.get_rect(
-                    center=scene_screen.get_rect().center)
-                display_text_pos.y += 152
-                scene_screen.blit(background, display_text_pos)
-                scene_screen.blit(display_text, display_text_pos)
-
-                pygame.display.update((box_rect, prompt_pos))
-                header_pos.y += 200
+    # Sleep until the player presses a key instead of polling.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+    _wait_for_key()
+
+    key = ("try again", scene_screen.get_size())
+    scene = _scene_cache.get(key)
+    if scene is None:
+        scene = _scene_cache[key] = _build_try_again(key[1])
+    scene_screen.blit(scene, (0, 0))
+
+    pygame.display.flip()
+    _wait_for_key()
+
+
+def _build_try_again(size):
+    """Draw and return the screen that prompts the player to try again.
+
+    The screen is the same after every game, so it is only drawn
+    once and then blitted whole by _leaderboard().
+
+    Keyword argument:
+    size - the dimensions of the display surface.
+
+    Return:
+    a Pygame surface object of the whole screen.
+    """
+    scene = pygame.Surface(size).convert()
+    scene.fill((0, 0, 0))
+    area = scene.get_rect()
+
+    prompt = _render(load_font(36, underline=True),
+                     "Press Any Key to Try Again",
+                     (255, 255, 255), (0, 0, 0))
+    prompt_pos = prompt.get_rect(center=area.center)
+    scene.blit(prompt, prompt_pos)
+
+    display_text = _render(
+        load_font(28), "Press the Escape Key to Exit the Game",
+        (255, 255, 255), (0, 0, 0))
+    display_text_pos = display_text.get_rect(center=area.center)
+    display_text_pos.y += 152
+    scene.blit(display_text, display_text_pos)
+    return scene
+
+
+@functools.lru_cache(maxsize=16)
+def load_font(size, underline=False, bold=False, italic=False):
+    """Load and return Pygame's default font, once per size and style.
+
+    The returned font is shared between callers, so its style
+    must not be changed after it is returned.
+
+    Keyword argument:
+    size - the height of the font in pixels.
+
+    Optional arguments:
+    underline - whether the font is underlined.
+    bold - whether the font is rendered bold.
+    italic - whether the font is rendered italic.
+
+    Return:
+    a Pygame font object.
+    """
+    font = pygame.font.Font(None, size)
+    font.set_underline(underline)
+    font.set_bold(bold)
+    font.set_italic(italic)
+    return font
+
+
+def _render(font, text, fg=(0, 0, 0), bg=(220, 220, 220)):
+    """Render and return text, reusing a previously rendered surface.
+
+    The surface is rendered antialiased over the background color,
+    so it is meant to be blitted onto an area already filled with
+    that color. Text blitted over anything else should be rendered
+    with a bg of None, which blends it with per pixel alpha.
+
+    Keyword arguments:
+    font - the Pygame font object to render the text with.
+           Fonts should come from load_font(), so that the same
+           object (and the same cache entry) is used every call.
+    text - the string to render.
+
+    Optional arguments:
+    fg - the color of the text.
+         Default is black.
+    bg - the background color of the text.
+         None renders the text as a per pixel alpha surface.
+         Default is the light grey of the leaderboard.
+
+    Return:
+    a Pygame surface object of the rendered text.
+    """
+    key = (font, text, fg, bg)
+    surface = _render_cache.get(key)
+    if surface is None:
+        if bg is None:
+            surface = font.render(text, 1, fg).convert_alpha()
+        else:
+            surface = font.render(text, 1, fg, bg).convert()
+        _render_cache[key] = surface
+    return surface
+
+
+def _render_multiline(font, lines, fg=(0, 0, 0), bg=(220, 220, 220),
+                      line_height=None):
+    """Render lines of text onto one surface, reusing a previous one.
+
+    Each line is centered horizontally on the surface. Like
+    _render(), the surface is rendered over the background color
+    and cached in _render_cache.
+
+    Keyword arguments:
+    font - the Pygame font object to render the text with.
+    lines - a tuple of the strings to render, one per line.
+
+    Optional arguments:
+    fg - the color of the text.
+         Default is black.
+    bg - the background color of the text.
+         Default is the light grey of the leaderboard.
+    line_height - the distance between the tops of two lines.
+                  Default is the line size of the font.
+
+    Return:
+    a Pygame surface object of the rendered lines.
+    """
+    if line_height is None:
+        line_height = font.get_linesize()
+    key = (font, lines, fg, bg, line_height)
+    surface = _render_cache.get(key)
+    if surface is None:
+        sizes = [font.size(line) for line in lines]
+        width = max(size[0] for size in sizes)
+        height = line_height*(len(lines) - 1) + sizes[-1][1]
+        surface = pygame.Surface((width, height)).convert()
+        surface.fill(bg)
+        for i, (line, size) in enumerate(zip(lines, sizes)):
+            surface.blit(font.render(line, 1, fg, bg),
+                         (width//2 - size[0]//2, line_height*i))
+        _render_cache[key] = surface
+    return surface
 
 
 class InstructionScreen(_Scene):
@@ -756,14 +580,7 @@ class InstructionScreen(_Scene):
         super().__init__(caption, framerate_cap, size)
 
         _instructions(self._screen, self._background)
-        while self._active:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        sys.exit()
-                    self._active = False
+        _wait_for_key()
 
 
 class RuleScreen(_Scene):
@@ -785,15 +602,8 @@ class RuleScreen(_Scene):
         super().__init__(caption, framerate_cap, size)
 
         _rules(self._screen, self._background)
-        while self._active:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        sys.exit()
-                    self._screen.blit(self._background, (0, 0))
-                    self._active = False
+        _wait_for_key()
+        self._screen.blit(self._background, (0, 0))
 
 
 class StartScreen(_Scene):
@@ -817,40 +627,29 @@ class StartScreen(_Scene):
         super().__init__(caption, framerate_cap, size)
 
         self._area = self._background.get_rect()
-        self._header_font = pygame.font.Font(None, 86)
-        self._prompt_font = pygame.font.Font(None, 36)
-
-        self._prompt_font.set_underline(True)
+        self._header_font = load_font(86)
+        self._prompt_font = load_font(36, underline=True)
 
         self._title_snake, self._title_snake_pos = load_image(
             "snake.png", 0, (300, 300))
         self._title_snake_pos.center = self._area.center
         self._screen.blit(self._title_snake, self._title_snake_pos)
 
-        header = self._header_font.render(
-            "SNAKE GAME", 1, (255, 255, 255)).convert_alpha()
+        header = _render(self._header_font, "SNAKE GAME",
+                         (255, 255, 255), None)
         header_pos = header.get_rect(center=self._area.center)
         self._screen.blit(header, header_pos)
 
-        prompt = self._prompt_font.render(
-            "Press Any Key to Start", 1, (255, 255, 255), (0, 0, 0)).convert()
-        prompt.set_colorkey((0, 0, 0))
+        prompt = _render(self._prompt_font, "Press Any Key to Start",
+                         (255, 255, 255), None)
         prompt_pos = prompt.get_rect(midbottom=self._area.midbottom)
         prompt_pos.y -= 152
-        self._screen.blit(self._background, prompt_pos)
         self._screen.blit(prompt, prompt_pos)
 
-        pygame.display.update((self._title_snake_pos, header_pos, prompt_pos))
+        pygame.display.flip()
 
-        while self._active:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        sys.exit()
-                    self._screen.blit(self._background, (0, 0))
-                    self._active = False
+        _wait_for_key()
+        self._screen.blit(self._background, (0, 0))
 
 
 def _game_over(scene_screen, background):
@@ -872,41 +671,47 @@ def _game_over(scene_screen, background):
     pygame.display.set_caption("Snake Game - Game Over")
     area = background.get_rect()
 
-    header_font = pygame.font.Font(None, 86)
-    prompt_font = pygame.font.Font(None, 36)
+    header_font = load_font(86)
+    prompt_font = load_font(36, underline=True)
 
-    prompt_font.set_underline(True)
+    player_death_sound = load_sound("church_bell.wav", 0.14)
 
-    player_death_sound = load_sound("church_bell.wav")
-    player_death_sound.set_volume(0.14)
-
-    header = header_font.render("GAME OVER", 1, (255, 255, 255),
-                                (0, 0, 0)).convert()
-    header.set_colorkey((0, 0, 0))
+    header = _render(header_font, "GAME OVER", (255, 255, 255), None)
     header_pos = header.get_rect(center=area.center)
-    scene_screen.blit(background, header_pos)
     scene_screen.blit(header, header_pos)
 
-    prompt = prompt_font.render("Press Any Key to Continue", 1,
-                                (255, 255, 255), (0, 0, 0)).convert()
-    prompt.set_colorkey((0, 0, 0))
+    prompt = _render(prompt_font, "Press Any Key to Continue",
+                     (255, 255, 255), None)
     prompt_pos = prompt.get_rect(midbottom=area.midbottom)
     prompt_pos.y -= 152
-    scene_screen.blit(background, prompt_pos)
     scene_screen.blit(prompt, prompt_pos)
 
     pygame.mixer.Sound.play(player_death_sound, 0)
-    pygame.display.update((header_pos, prompt_pos))
+    pygame.display.flip()
+
+    _wait_for_key()
 
-    active = True
-    while active:
-        for event in pygame.event.get():
+
+def _wait_for_key():
+    """Wait until the player presses a key.
+
+    Sleeps on the event queue rather than polling it. Once
+    woken, the quit and key events left in the queue are
+    drained, so keys pressed together only continue past
+    one screen.
+    Exits the game if the window is closed or if
+    the Escape key is pressed.
+    """
+    while True:
+        events = [pygame.event.wait()]
+        events.extend(pygame.event.get((pygame.QUIT, pygame.KEYDOWN)))
+        for event in events:
             if event.type == pygame.QUIT:
                 sys.exit()
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                sys.exit()
             elif event.type == pygame.KEYDOWN:
-                active = False
+                if event.key == pygame.K_ESCAPE:
+                    sys.exit()
+                return
 
 
 def _rules(scene_screen, background):
@@ -922,83 +727,53 @@ def _rules(scene_screen, background):
                  to render text more efficiently on
                  the display surface.
     """
-    header_font = pygame.font.Font(None, 36)
-    text_font = pygame.font.Font(None, 28)
-    prompt_font = pygame.font.Font(None, 36)
+    area = background.get_rect()
 
-    header_font.set_underline(True)
-    prompt_font.set_bold(True)
+    header_font = load_font(36, underline=True)
+    text_font = load_font(28)
+    prompt_font = load_font(36, bold=True)
 
-    header = header_font.render("RULES", 1,
-                                (255, 255, 255), (0, 0, 0)).convert()
-    header.set_colorkey((0, 0, 0))
-    header_pos = header.get_rect(midtop=background.get_rect().midtop)
+    header = _render(header_font, "RULES", (255, 255, 255), None)
+    header_pos = header.get_rect(midtop=area.midtop)
     header_pos.y += 4
-    scene_screen.blit(header, header_pos)
-
-    test_display = text_font.render(
-        "1) Score points by keeping the snake alive and eating apples.", 1,
-        (255, 255, 255), (0, 0, 0)).convert()
-    test_display.set_colorkey((0, 0, 0))
-    test_display_pos = test_display.get_rect(
-        center=background.get_rect().center)
-    test_display_pos.y -= 98
-    scene_screen.blit(test_display, test_display_pos)
-
-    test_display = text_font.render(
-        "2) The game ends when the snake's head touches", 1,
-        (255, 255, 255), (0, 0, 0)).convert()
-    test_display_pos.y += 52
-    scene_screen.blit(test_display, test_display_pos)
-
-    test_display = text_font.render(
-        "     its own body or moves outside the window screen.", 1,
-        (255, 255, 255), (0, 0, 0)).convert()
-    test_display_pos.y += 26
-    scene_screen.blit(test_display, test_display_pos)
-
-    test_display = text_font.render(
-        "3) Eating apples will elongate the snake's body.", 1,
-        (255, 255, 255), (0, 0, 0)).convert()
-    test_display_pos.y += 52
-    scene_screen.blit(test_display, test_display_pos)
-
-    test_display = text_font.render(
-        "4) The player (snake) only has one life.", 1,
-        (255, 255, 255), (0, 0, 0)).convert()
-    test_display_pos.y += 52
-    scene_screen.blit(test_display, test_display_pos)
-
-    test_display = text_font.render(
-        "     Ending the game requires the player to", 1,
-        (255, 255, 255), (0, 0, 0)).convert()
-    test_display_pos.y += 26
-    scene_screen.blit(test_display, test_display_pos)
-
-    test_display = text_font.render(
-        "     start from the beginning again.", 1,
-        (255, 255, 255), (0, 0, 0)).convert()
-    test_display_pos.y += 26
-    scene_screen.blit(test_display, test_display_pos)
-
-    prompt = prompt_font.render(
-        "     Press Any Key (except for Escape) to Continue", 1,
-        (255, 255, 255), (0, 0, 0)).convert()
-    prompt_pos = prompt.get_rect(
-        midbottom=background.get_rect().midbottom)
+    blit_list = [(header, header_pos)]
+
+    # Every line is left aligned with the first one; the offsets
+    # are relative to the first line centered on the screen.
+    lines = (
+        ("1) Score points by keeping the snake alive and eating apples.",
+         -98),
+        ("2) The game ends when the snake's head touches", -46),
+        ("     its own body or moves outside the window screen.", -20),
+        ("3) Eating apples will elongate the snake's body.", 32),
+        ("4) The player (snake) only has one life.", 84),
+        ("     Ending the game requires the player to", 110),
+        ("     start from the beginning again.", 136))
+    text_x = text_y = None
+    for text, y_offset in lines:
+        test_display = _render(text_font, text, (255, 255, 255), (0, 0, 0))
+        if text_x is None:
+            text_x, text_y = test_display.get_rect(center=area.center).topleft
+        blit_list.append((test_display, (text_x, text_y + y_offset)))
+
+    prompt = _render(
+        prompt_font, "     Press Any Key (except for Escape) to Continue",
+        (255, 255, 255), (0, 0, 0))
+    prompt_pos = prompt.get_rect(midbottom=area.midbottom)
     prompt_pos.y -= 4
-    scene_screen.blit(prompt, prompt_pos)
+    blit_list.append((prompt, prompt_pos))
 
     example_image, example_rect = load_image('snake.png', 0, (110, 110))
-    example_rect.x = background.get_rect().centerx * 0.92
-    example_rect.y = background.get_rect().centery * 0.38
-    scene_screen.blit(example_image, example_rect)
+    example_rect.x = area.centerx * 0.92
+    example_rect.y = area.centery * 0.38
+    blit_list.append((example_image, example_rect))
 
     example_image, example_rect = load_image('apple.png', 0, (110, 110))
-    example_rect.x = background.get_rect().centerx * 1.6
-    example_rect.y = background.get_rect().centery * 0.34
-    scene_screen.blit(example_image, example_rect)
+    example_rect.x = area.centerx * 1.6
+    example_rect.y = area.centery * 0.34
+    blit_list.append((example_image, example_rect))
 
+    scene_screen.blits(blit_list, 0)
     pygame.display.update()
 
 
@@ -1015,76 +790,45 @@ def _instructions(scene_screen, background):
                  to render text more efficiently on
                  the display surface.
     """
-    header_font = pygame.font.Font(None, 36)
-    text_font = pygame.font.Font(None, 28)
-    or_font = pygame.font.Font(None, 28)
-    prompt_font = pygame.font.Font(None, 36)
-
-    header_font.set_underline(True)
-    or_font.set_italic(True)
-    prompt_font.set_bold(True)
-
-    header = header_font.render(
-        "CONTROLS", 1, (255, 255, 255), (0, 0, 0)).convert()
-    header.set_colorkey((0, 0, 0))
-    header_pos = header.get_rect(
-        midtop=background.get_rect().midtop)
-    header_pos.y += 4
-    scene_screen.blit(header, header_pos)
+    area = background.get_rect()
 
-    text_display = text_font.render(
-        "W = Up", 1, (255, 255, 255), (0, 0, 0)).convert()
-    text_display.set_colorkey((0, 0, 0))
-    text_display_pos = text_display.get_rect(
-        center=background.get_rect().center)
-    text_display_pos.y -= 98
-    scene_screen.blit(text_display, text_display_pos)
-
-    text_display = text_font.render("A = Left, S = Down, D = Right", 1,
-                                    (255, 255, 255), (0, 0, 0)).convert()
-    text_display_pos = text_display.get_rect(
-        center=background.get_rect().center)
-    text_display_pos.y -= 72
-    scene_screen.blit(text_display, text_display_pos)
-
-    or_text = or_font.render("or", 1, (255, 255, 255), (0, 0, 0)).convert()
-    or_text.set_colorkey((0, 0, 0))
-    or_text_pos = or_text.get_rect(
-        center=background.get_rect().center)
-    or_text_pos.y -= 36
-    scene_screen.blit(or_text, or_text_pos)
-
-    text_display = text_font.render(
-        "Up Arrow = Up", 1, (255, 255, 255), (0, 0, 0)).convert()
-    text_display_pos = text_display.get_rect(
-        center=background.get_rect().center)
-    scene_screen.blit(text_display, text_display_pos)
-
-    text_display = text_font.render(
-        "Left Arrow = Left, Down Arrow = Down, Right Arrow = Right", 1,
-        (255, 255, 255), (0, 0, 0)).convert()
-    text_display_pos = text_display.get_rect(
-        center=background.get_rect().center)
-    text_display_pos.y += 26
-    scene_screen.blit(text_display, text_display_pos)
-
-    text_display = text_font.render(
-        "Press the \"Escape\" key to quit from the game any time.", 1,
-        (255, 255, 255), (0, 0, 0)).convert()
-    text_display_pos = text_display.get_rect(
-        center=background.get_rect().center)
-    text_display_pos.y += 104
-    scene_screen.blit(text_display, text_display_pos)
-
-    prompt = prompt_font.render(
-        "Press Any Key (except for Escape) to Continue", 1,
-        (255, 255, 255), (0, 0, 0)).convert()
-    prompt.set_colorkey((0, 0, 0))
-    prompt_pos = prompt.get_rect(
-        midbottom=background.get_rect().midbottom)
+    header_font = load_font(36, underline=True)
+    text_font = load_font(28)
+    or_font = load_font(28, italic=True)
+    prompt_font = load_font(36, bold=True)
+
+    header = _render(header_font, "CONTROLS", (255, 255, 255), None)
+    header_pos = header.get_rect(midtop=area.midtop)
+    header_pos.y += 4
+    blit_list = [(header, header_pos)]
+
+    # Each block is centered horizontally on the screen. The offsets
+    # are from the first line of the block centered on the screen.
+    center_x, center_y = area.center
+    blocks = (
+        (text_font, ("W = Up", "A = Left, S = Down, D = Right"), -98),
+        (or_font, ("or",), -36),
+        (text_font,
+         ("Up Arrow = Up",
+          "Left Arrow = Left, Down Arrow = Down, Right Arrow = Right"), 0),
+        (text_font,
+         ("Press the \"Escape\" key to quit from the game any time.",), 104))
+    for font, lines, y_offset in blocks:
+        text_display = _render_multiline(
+            font, lines, (255, 255, 255), (0, 0, 0), 26)
+        first_height = font.size(lines[0])[1]
+        text_display_pos = text_display.get_rect(
+            centerx=center_x, top=center_y - first_height//2 + y_offset)
+        blit_list.append((text_display, text_display_pos))
+
+    prompt = _render(
+        prompt_font, "Press Any Key (except for Escape) to Continue",
+        (255, 255, 255), None)
+    prompt_pos = prompt.get_rect(midbottom=area.midbottom)
     prompt_pos.y -= 4
-    scene_screen.blit(prompt, prompt_pos)
+    blit_list.append((prompt, prompt_pos))
 
+    scene_screen.blits(blit_list, 0)
     pygame.display.update()
 
 
@@ -1112,6 +856,9 @@ def load_image(name, is_alpha=1, resize=(0, 0), colorkey=None):
     Return:
     a Pygame surface object of the requested image
     and the pygame rect object of the surface.
+    The surface is shared between calls with the same
+    arguments and should not be drawn on; the rect is
+    new on every call.
 
     Exception:
     Raise SystemExit - if the specified file is not
@@ -1120,6 +867,33 @@ def load_image(name, is_alpha=1, resize=(0, 0), colorkey=None):
                        exit the user from Python with
                        a 'Cannot load image:' message.
     """
+    image = _load_image(name, is_alpha, resize, colorkey)
+    return image, image.get_rect()
+
+
+def preload_images(manifest):
+    """Load every image of a manifest into load_image()'s cache.
+
+    Meant to be called once the display mode is set, since
+    the images are converted to the display's pixel format.
+
+    Keyword argument:
+    manifest - an iterable of tuples of load_image() arguments.
+    """
+    for args in manifest:
+        load_image(*args)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_image(name, is_alpha, resize, colorkey):
+    """Load, convert and return a specified image file.
+
+    The loaded surface is cached, so each image is only decoded
+    and resized once. See load_image() for the arguments.
+
+    Return:
+    a Pygame surface object of the requested image.
+    """
     fullname = os.path.join('images', name)
     try:
         image = pygame.image.load(fullname)
@@ -1127,21 +901,22 @@ def load_image(name, is_alpha=1, resize=(0, 0), colorkey=None):
         print('Cannot load image:', name)
         raise SystemExit from message
 
-    if resize != (0, 0):
+    if resize != (0, 0) and image.get_size() != resize:
         image = pygame.transform.smoothscale(image, resize)
 
-    if is_alpha == 0:
+    if not is_alpha:
         image = image.convert_alpha()
-    elif is_alpha != 0:
+    else:
         image = image.convert()
-    if is_alpha != 0 and colorkey is not None:
-        if colorkey is -1:
-            colorkey = image.get_at((0, 0))
-        image.set_colorkey(colorkey, pygame.RLEACCEL)
-    return image, image.get_rect()
+        if colorkey is not None:
+            if colorkey == -1:
+                colorkey = image.get_at((0, 0))
+            image.set_colorkey(colorkey, pygame.RLEACCEL)
+    return image
 
 
-def load_sound(name):
+@functools.lru_cache(maxsize=16)
+def load_sound(name, volume=None):
     """Load and return a specified sound file if able.
 
     Keyword argument:
@@ -1149,8 +924,15 @@ def load_sound(name):
            expected to be found in the 'sounds'
            subdirectory.
 
+    Optional argument:
+    volume - sets the volume of the sound, from 0.0 to 1.0,
+             if given an argument.
+             Default is None (i.e. full volume).
+
     Return:
-    a Pygame Sound object of the requested sound
+    a Pygame Sound object of the requested sound.
+    The sound is shared between calls with the same
+    arguments, so each file is only decoded once.
 
     Exception:
     Raise SystemExit - if the specified file is not
@@ -1166,4 +948,7 @@ def load_sound(name):
     except pygame.error as message:
         print('Cannot load sound:', fullname)
         raise SystemExit from message
+
+    if volume is not None:
+        sound.set_volume(volume)
     return sound
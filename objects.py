@@ -13,10 +13,13 @@ Python, using Pygame.
 This module requires game_init.py to run.
 
 Classes:
-Body - Extends the Snake if it collides with an Apple.
+Dir - The directions the Snake can move in.
 Snake - Represent the Snake the player controls.
 Apple - Give the player points if they collide with this.
 ScoreText - Keeps track and display the player's score.
+
+Functions:
+preload_assets
 """
 
 __author__ = "Kenneth Doan"
@@ -24,128 +27,76 @@ __email__ = "snarbolax@csu.fullerton.edu"
 __version__ = "0.9"
 __license__ = "LGPL 2.1"
 
+import collections
+import enum
+import functools
 import random
 import pygame
 import game_init
 
 
-class Body(pygame.sprite.Sprite):
-    """A subclass of Pygame's Sprite class used to represent the Snake's body.
-
-    It is meant to be structured as a doubly-linked list,
-    where the _head member refers to the preceding Body object and
-    the _tail member refers to the succeeding Body object.
+def preload_assets():
+    """Load the images, sounds, and text of every object into cache.
 
-    It currently doesn't append more than 1 Body object properly.
-    Instead, it will spawn a static, persisting Body object at
-    the Body object that is following Snake properly, each time the
-    Snake collides with an Apple object.
-
-    Public methods:
-    update() - override the update method of Pygame's Sprite class.
-    add_tail()
-
-    Public instance variables:
-    self.image
-    self.rect
-    self.area
-    self.tail_rect
+    Each game creates new objects, which then only get cached
+    assets. Meant to be called once the display mode is set,
+    since the images and text are converted to its pixel format.
     """
+    for name in ('snake.png', 'snake_body.png', 'apple.png'):
+        game_init.load_image(name, 0, (49, 49))
+    for name, volume in (("whiish.wav", 0.11), ("whoosh.wav", 0.11),
+                         ("baby.wav", 0.5), ("sneeze.wav", 0.14)):
+        game_init.load_sound(name, volume)
+    _score_glyphs(game_init.load_font(36))
 
-    def __init__(self, head):
-        """Body's class constructor.
-
-        Keyword arguments:
-        self - the Body object itself
-        head - a Sprite that the Body is meant
-               to follow and gain movement from.
-
-        Return:
-        Body (sprite) object
 
-        Public instance variables:
-        self.image
-        self.rect
-        self.area
-        self.tail_rect
-        """
-        pygame.sprite.Sprite.__init__(self)
-        self.image, self.rect = game_init.load_image('snake_body.png',
-                                                     0, (49, 49))
+@functools.lru_cache(maxsize=4)
+def _score_glyphs(font):
+    """Render the text that the score is put together from.
 
-        self._head = head
+    Keyword arguments:
+    font - the font to render the text with.
 
-        screen = pygame.display.get_surface()
-        self.area = screen.get_rect()
-
-        self._has_tail = False
-
-        self.rect = self._head.tail_rect
-        self.tail_rect = self.rect
-
-    def update(self, body_group, game_display, background, count):
-        """Override the update method of Pygame's Sprite class.
-
-        Meant to blit and update the Body object upon a display
-        surface and append another Body object to itself by
-        calling the add_tail() method.
-
-        Keyword arguments:
-        self - the Body object itself
-        body_group - the group that the body object
-                     adds itself to upon initializing.
-        game_display - the display surface that the
-                       Body object blits and updates onto.
-        background - the surface that the Body object uses
-                     to blit and update more efficiently on
-                     the display surface.
-        count - a counter to keep track of how many Body
-                objects succeed the current Body. A count of
-                0 implies that the Body is the tail of the chain.
-        """
-        if not self.alive():
-            self.add(body_group)
-
-        if count == 0:
-            game_display.blit(background, self.rect)
+    Return:
+    a tuple of the rendered "Score: " and a list of the
+    rendered digits 0 to 9, each white on black.
+    """
+    prefix = font.render("Score: ", 1, (255, 255, 255), (0, 0, 0)).convert()
+    digits = [font.render(str(digit), 1, (255, 255, 255),
+                          (0, 0, 0)).convert()
+              for digit in range(10)]
+    return prefix, digits
 
-        self.tail_rect = self.rect
 
-        if count > 0:
-            if self._has_tail:
-                # self.new_body.rect = self.tail_rect
-                self.new_body.update(
-                    body_group, game_display, background, count-1)
-        else:
-            self.add_tail()
-        self.rect = self._head.tail_rect
+class Dir(enum.IntEnum):
+    """The directions the Snake can move in.
 
-        if count == 0:
-            game_display.blit(self.image, self.rect)
-            pygame.display.update((self.rect, self.tail_rect))
+    Opposite directions only differ in their lowest bit, so the
+    opposite of a direction is direction ^ 1.
+    """
 
-    def add_tail(self):
-        """Append a tail by initializing a new Body object"""
-        if not self._has_tail:
-            self.new_body = Body(self)
-            self._has_tail = True
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
 
 
 class Snake(pygame.sprite.Sprite):
     """A subclass of Pygame's Sprite class used to represent the Snake's head.
 
     Snake calls update() to change its (rect)position,
-    blit and updates itself upon a surface, and kills itself if it
-    moves out of the dimensions of the window screen display or if
-    it collides with a Body object.
+    and kills itself if it moves out of the dimensions of the
+    window screen display or if it collides with its own body.
+    The group that Snake is in draws it upon a surface, while
+    Snake draws its own body with clear_body() and draw_body().
 
     Public methods:
     update() - override the update method of Pygame's Sprite class.
-    moveup()
-    moveleft()
-    movedown()
-    moveright()
+    clear_body()
+    draw_body()
+    move()
     grow_body()
+    occupies()
 
     Public instance variables:
     self.image
@@ -153,8 +104,6 @@ class Snake(pygame.sprite.Sprite):
     self.area
     self.state
     self.movepos
-    self.tail_rect
-    self.body
     """
 
     def __init__(self):
@@ -167,139 +116,189 @@ class Snake(pygame.sprite.Sprite):
         self.image
         self.rect
         self.area
-        self.tail_rect
+        self.state
+        self.movepos
         """
         pygame.sprite.Sprite.__init__(self)
         self.image, self.rect = game_init.load_image('snake.png', 0, (49, 49))
 
-        self._vertical_move_sound = game_init.load_sound("whiish.wav")
-        self._horizontal_move_sound = game_init.load_sound("whoosh.wav")
-
-        self._vertical_move_sound.set_volume(0.11)
-        self._horizontal_move_sound.set_volume(0.11)
+        vertical_move_sound = game_init.load_sound("whiish.wav", 0.11)
+        horizontal_move_sound = game_init.load_sound("whoosh.wav", 0.11)
+        # Indexed by Dir.
+        self._sounds = (vertical_move_sound, vertical_move_sound,
+                        horizontal_move_sound, horizontal_move_sound)
+        self._deltas = ((0, -self.rect.height), (0, self.rect.height),
+                        (-self.rect.width, 0), (self.rect.width, 0))
 
         screen = pygame.display.get_surface()
         self.area = screen.get_rect()
 
-        self._updated = False
+        # The turn that the next update() makes, if any.
+        self._queued_dir = None
 
-        self.state = "movedown"
-        self.movepos = [0, 0]
+        self.state = Dir.DOWN
         # sub 20 fps allows the snake to "jump" the length of its body.
-        self.movepos[1] = self.movepos[1] + self.rect.width
+        self.movepos = self._deltas[Dir.DOWN]
         self.rect.midtop = self.area.midtop
 
-        self._has_tail = False
-        self.tail_rect = self.rect
+        # The rects of the body following the Snake, from its neck to
+        # its tail. The body is drawn from the one _body_image.
+        self._segments = collections.deque()
+        # The (x, y) positions of the body. Everything moves on the
+        # same grid, so the head collides with the body only if its
+        # position is in here.
+        self._occupied = set()
+        # How many more segments the Snake has yet to grow.
+        self._pending_growth = 0
+        # The tail's area that clear_body() erased this frame.
+        self._erased = None
+        self._body_image = game_init.load_image('snake_body.png',
+                                                0, (49, 49))[0]
+
+    def update(self):
+        """Override the update method of Pygame's Sprite class.
 
-        self._add_tail = 0
-        self._tail_count = 0
+        Updates the Snake's position, which is changed by calling
+        move(), and kills itself if the Snake's position is not
+        entirely within the dimensions of the window screen display
+        or if the Snake collides with its own body.
+        The Snake object is drawn by the group it is in, which
+        only updates the Snake while it is alive.
 
-        self.new_body = Body(self)
+        Keyword arguments:
+        self - the Snake object itself
+        """
+        if self._queued_dir is not None:
+            self.state = self._queued_dir
+            self.movepos = self._deltas[self._queued_dir]
+            self._queued_dir = None
+
+        # Only the tail moves, to the position the head is leaving.
+        # When growing, a new segment is put there instead.
+        if self._pending_growth > 0:
+            self._pending_growth -= 1
+            self._segments.appendleft(self.rect.copy())
+        elif self._segments:
+            segment = self._segments.pop()
+            self._occupied.discard(segment.topleft)
+            segment.topleft = self.rect.topleft
+            self._segments.appendleft(segment)
+        if self._segments:
+            self._occupied.add(self.rect.topleft)
+        self.rect.move_ip(self.movepos)
+
+        if not self.area.contains(self.rect):
+            self.kill()
+        if self.rect.topleft in self._occupied:
+            self.kill()
+
+    def clear_body(self, game_display, background):
+        """Erase the end of the Snake's tail before it moves.
+
+        The rest of the body stays where it was drawn, since only the
+        tail moves. If the Snake grows instead, draw_body() draws
+        the tail again.
 
-    def update(self, body_group, self_group, game_display, background):
-        """Override the update method of Pygame's Sprite class.
+        Keyword arguments:
+        self - the Snake object itself
+        game_display - the display surface that the
+                       body was drawn upon.
+        background - the surface that the body is erased with.
+        """
+        if self._segments:
+            tail_rect = self._segments[-1]
+            self._erased = game_display.blit(background, tail_rect,
+                                             tail_rect)
 
-        Blit and update the Snake object upon a display
-        surface, updates the Snake's position by calling
-        moveup(), movedown(), moveleft(), or moveright(), and
-        kills itself if the Snake's position is entirely
-        within the dimensions of the window screen display or if
-        the Snake collides with a Body object.
+    def draw_body(self, game_display, covered=()):
+        """Blit the parts of the Snake's body that changed this frame.
+
+        That is the neck, where the head was erased from, the tail if
+        it was erased but didn't move, and any part of the body that
+        was drawn over since the last frame.
 
         Keyword arguments:
-        self - the Body object itself
-        body_group - the sprite group that the Snake adds the first
-                     body object to upon colliding with an Apple.
-        self_group - the sprite group that the Snake is in. Used to
-                     detect if Snake is alive or dead.
+        self - the Snake object itself
         game_display - the display surface that the
-                       Snake object blits and updates onto.
-        background - the surface that the Snake object uses
-                     to blit and update more efficiently on
-                     the display surface.
+                       body is drawn upon.
+
+        Optional argument:
+        covered - the areas of game_display that were drawn
+                  over this frame, such as by the score.
+
+        Return:
+        a list of the Pygame rect objects of the areas of
+        game_display that the body was erased from or drawn on.
+        """
+        dirty = []
+        if self._erased is not None:
+            dirty.append(self._erased)
+        segments = self._segments
+        if segments:
+            image = self._body_image
+            # The neck moved to where the head was erased from.
+            redrawn = {0}
+            if len(segments) > 1 and segments[-1] == self._erased:
+                redrawn.add(len(segments) - 1)
+            blit_list = [(image, segments[index]) for index in redrawn]
+
+            if covered:
+                rects = list(segments)
+                for area in covered:
+                    for index in area.collidelistall(rects):
+                        if index not in redrawn:
+                            clip = rects[index].clip(area)
+                            blit_list.append(
+                                (image, clip, clip.move(-rects[index].x,
+                                                        -rects[index].y)))
+            dirty += game_display.blits(blit_list)
+        self._erased = None
+        return dirty
+
+    def move(self, direction):
+        """Queue a turn for the Snake to make on its next update.
+
+        The Snake can't turn to the direction it is already moving
+        in or to its opposite. Only the first turn queued before an
+        update is kept, which prevents the Snake from moving
+        backwards by turning twice.
+
+        Keyword arguments:
+        self - the Snake object itself
+        direction - the Dir to move in.
         """
-        if self.alive():
-            game_display.blit(background, self.rect)
-            if self._has_tail:
-                self.tail_rect = self.rect
-                if self._tail_count > 0:
-                    self._tail_count = self._add_tail
-                self.new_body.update(body_group, game_display,
-                                     background, self._tail_count)
-                self._tail_count = 0
-            newpos = self.rect.move(self.movepos)
-            self.rect = newpos
-            self._updated = True
-
-            if not game_display.get_rect().contains(self.rect):
-                pygame.display.update(self_group.draw(game_display))
-                self.kill()
-                game_display.blit(background, self.rect)
-            if pygame.sprite.spritecollideany(self, body_group) is not None:
-                pygame.display.update(self_group.draw(game_display))
-                self.kill()
-                game_display.blit(background, self.rect)
-            pygame.display.update(self_group.draw(game_display))
-
-    def moveup(self):
-        """Subtract the Snake's height from its y position to move up."""
-        if not (self.state == "movedown" or self.state == "moveup"):
-            if self._updated:  # Prevents the snake from moving backwards.
-                if self.alive():
-                    self.movepos[1] = self.movepos[1] - self.rect.height
-                    self.movepos[0] = 0
-                    self.state = "moveup"
-                    pygame.mixer.Sound.play(self._vertical_move_sound)
-                    self._updated = False
-
-    def moveleft(self):
-        """Subtract the Snake's width from its x position to move left."""
-        if not (self.state == "moveright" or self.state == "moveleft"):
-            if self._updated:
-                if self.alive():
-                    self.movepos[0] = self.movepos[0] - self.rect.width
-                    self.movepos[1] = 0
-                    self.state = "moveleft"
-                    pygame.mixer.Sound.play(self._horizontal_move_sound)
-                    self._updated = False
-
-    def movedown(self):
-        """Add the Snake's height to its y position to move down."""
-        if not (self.state == "moveup" or self.state == "movedown"):
-            if self._updated:
-                if self.alive():
-                    self.movepos[1] = self.movepos[1] + self.rect.height
-                    self.movepos[0] = 0
-                    self.state = "movedown"
-                    pygame.mixer.Sound.play(self._vertical_move_sound)
-                    self._updated = False
-
-    def moveright(self):
-        """Add the Snake's width from its x position to move right."""
-        if not (self.state == "moveleft" or self.state == "moveright"):
-            if self._updated:
-                if self.alive():
-                    self.movepos[0] = self.movepos[0] + self.rect.width
-                    self.movepos[1] = 0
-                    self.state = "moveright"
-                    pygame.mixer.Sound.play(self._horizontal_move_sound)
-                    self._updated = False
+        state = self.state
+        if (self._queued_dir is not None
+                or direction == state or direction == (state ^ 1)):
+            return
+        self._queued_dir = direction
+        pygame.mixer.Sound.play(self._sounds[direction])
 
     def grow_body(self):
-        """Tell Snake to append a Body object to itself."""
-        if self._has_tail:
-            self._add_tail += 1
-            self._tail_count = self._add_tail
-        self._has_tail = True
+        """Tell Snake to append a segment to its body."""
+        self._pending_growth += 1
+
+    def occupies(self, pos):
+        """Check if the Snake's head or body is at a position.
+
+        Keyword arguments:
+        self - the Snake object itself
+        pos - the (x, y) position of a cell on the Snake's grid.
+
+        Return:
+        True if the head or the body is at pos,
+        or False otherwise.
+        """
+        return pos == self.rect.topleft or pos in self._occupied
 
 
 class Apple(pygame.sprite.Sprite):
     """A subclass of Pygame's Sprite class used to represent an Apple.
 
-    The Apple object blits, updates, and spawns itself within
-    the dimensions of the window screen display, while avoiding to
-    appear on the edges of the display surface.
+    The Apple object spawns itself on the Snake's grid within the
+    dimensions of the window screen display, while avoiding to
+    appear on the edges of the display surface. The group that
+    the Apple is in draws it upon a surface.
 
     The Apple attempts to spawn every 5 seconds and a limit of 1 can
     only exist on the screen at any given.
@@ -309,15 +308,20 @@ class Apple(pygame.sprite.Sprite):
 
     Public methods:
     update() - override the update method of Pygame's Sprite class.
+    update_spawn_timer()
 
     Public instance variables:
     self.image
     self.rect
     """
 
-    def __init__(self):
+    def __init__(self, snake):
         """Apple's class constructor.
 
+        Keyword arguments:
+        snake - the Snake object whose grid the Apple spawns on.
+                The Apple does not spawn on the Snake itself.
+
         Return:
         Apple (sprite) object
 
@@ -326,110 +330,115 @@ class Apple(pygame.sprite.Sprite):
         self.rect
         """
         pygame.sprite.Sprite.__init__(self)  # call Sprite intializer
-        self.image, self.rect = game_init.load_image('apple.png', 0, (50, 50))
-        self._spawn_sound = game_init.load_sound("baby.wav")
-        self._death_sound = game_init.load_sound("sneeze.wav")
-
-        self._spawn_sound.set_volume(0.5)
-        self._death_sound.set_volume(0.14)
+        self.image, self.rect = game_init.load_image('apple.png', 0, (49, 49))
+        self._spawn_sound = game_init.load_sound("baby.wav", 0.5)
+        self._death_sound = game_init.load_sound("sneeze.wav", 0.14)
 
         screen = pygame.display.get_surface()
         self._spawn_timer = 5
 
         self._area = screen.get_rect()
-        self._pos = [random.randint(self._area.left+self.rect.width,
-                                    self._area.right-self.rect.width),
-                     random.randint(self._area.top+self.rect.height,
-                                    self._area.bottom-self.rect.height)]
-        self.rect.centerx, self.rect.centery = self._pos[0], self._pos[1]
-        self._old_rect = (0, 0)
-
-    def _spawn(self, snake, bodies):
-        """Blit and update an Apple to a random location.
+        # The positions of the cells of the Snake's grid that the
+        # Apple can spawn on, which excludes the edges of the screen.
+        width, height = snake.rect.size
+        columns = range(snake.rect.x % width,
+                        self._area.right - width + 1, width)
+        rows = range(snake.rect.y % height,
+                     self._area.bottom - height + 1, height)
+        self._cells = [(x, y) for x in columns[1:-1] for y in rows[1:-1]]
+        self.rect.topleft = random.choice(
+            [cell for cell in self._cells if cell != snake.rect.topleft])
+
+    def _spawn(self, snake):
+        """Move the Apple to a random free cell.
 
         Intended to only be called while the Apple object
         is not alive. The method will avoid spawning the
-        Apple object on a Snake object, Body object, the
+        Apple object on the Snake or its body, the
         last location of the Apple object before it was
         killed, and the edges of the window screen display.
+        A few random cells are tried first, since most of the grid
+        is usually free. If they are all taken, the Apple is
+        picked from the list of free cells instead.
 
         Keyword arguments:
         self - the Apple object itself
         snake - the Snake object that the method avoids
-                spawning the Apple on
-        bodies - the group that Body objects are kept in.
-                 The method avoid spawning the Apple on
-                 any of the members in this group.
+                spawning the Apple on, including its body.
+
+        Return:
+        True if the Apple was moved, or False
+        if there are no free cells left.
         """
-        while True:
-            pos_x = random.randint(self._area.left+self.rect.width,
-                                   self._area.right-self.rect.width)
-            pos_y = random.randint(self._area.top+self.rect.height,
-                                   self._area.bottom-self.rect.height)
-
-            self._pos = [pos_x, pos_y]
-            self.rect.centerx, self.rect.centery = self._pos[0], self._pos[1]
-            if not ((pygame.sprite.collide_rect(snake, self)
-                     and (pygame.sprite.spritecollideany(self, bodies))
-                     and (self.rect == self._old_rect))):
-                pygame.mixer.Sound.play(self._spawn_sound)
+        last = self.rect.topleft
+        occupies = snake.occupies
+        cells = self._cells
+        for _ in range(4):
+            cell = cells[random.randrange(len(cells))]
+            if cell != last and not occupies(cell):
                 break
-
-    def update(self, snake, bodies, self_group,
-               game_display, background, score_sprite):
+        else:
+            free = [cell for cell in cells
+                    if cell != last and not occupies(cell)]
+            if not free:
+                return False
+            cell = random.choice(free)
+
+        self.rect.topleft = cell
+        pygame.mixer.Sound.play(self._spawn_sound)
+        return True
+
+    def update(self, snake, game_display, background,
+               score_sprite, dirty_rects):
         """Override the update method of Pygame's Sprite class.
 
-        The Apple object blits, updates, and spawns itself within
-        the dimensions of the window screen display, while avoiding to
-        appear on the edges of the display surface.
+        Only called while the Apple is alive. The Apple object kills
+        itself and updates the Score sprite by 50 points if the
+        Snake object collides with the Apple.
 
-        The Apple attempts to call _spawn() every 5 second and will
-        only successfully call _spawn() if the Apple object is not alive.
+        Keyword arguments:
+        self - the Apple object itself
+        snake - the Snake object that may collide with the Apple.
+        game_display - the display surface that is passed to
+                       the score sprite's update method.
+        background - the surface that is passed to the
+                     score sprite's update method.
+        score_sprite - the score sprite whose update method
+                       that Apple calls upon to update the
+                       player's score.
+        dirty_rects - the list of this frame's changed areas of the
+                      display, passed to the score sprite's
+                      update method.
+        """
+        # Both are on the same grid, so they only collide if they
+        # are in the same cell.
+        if snake.rect.topleft == self.rect.topleft:
+            snake.grow_body()
 
-        The Apple object kill itself and update the Score sprite by
-        50 points if the Snake object collides with the Apple.
+            self.kill()
+            pygame.mixer.Sound.play(self._death_sound)
+
+            score_sprite.update(game_display, background, dirty_rects, 50)
+
+    def update_spawn_timer(self, dt, snake, self_group):
+        """Count down to the Apple's next attempt to spawn.
+
+        The Apple attempts to call _spawn() every 5 seconds and will
+        only successfully call _spawn() if the Apple object is not alive.
 
         Keyword arguments:
         self - the Apple object itself
+        dt - the seconds that have passed since the last frame.
         snake - the Snake object that is passed to _spawn(),
                 to prevent the Apple from spawning on.
-        bodies - the sprite group that is passed to _spawn(),
-                 to prevent the Apple from spawning on the
-                 group's members.
-        self_group - the sprite group that the Apple is in.
-                     Used to detect if Apple is alive or dead.
-        game_display - the display surface that the
-                       Apple object blits and updates onto.
-        background - the surface that the Apple object uses
-                     to blit and update more efficiently on
-                     the display surface.
-        score_sprite - the score sprite whose update method
-                       that Apple calls upon to update the
-                       player's score.
+        self_group - the sprite group that the Apple is added to
+                     when it spawns.
         """
-        if self.alive():
-            if not self.rect == self._old_rect:
-                game_display.blit(background, self.rect)
-                pygame.display.update(self_group.draw(game_display))
-        if pygame.sprite.collide_rect(snake, self):
-            if self.alive():
-                if snake.alive():
-                    snake.grow_body()
-
-                    self.kill()
-                    game_display.blit(background, self.rect)
-                    pygame.display.update(self.rect)
-                    pygame.mixer.Sound.play(self._death_sound)
-
-                    score_sprite.update(game_display, background, 50)
+        self._spawn_timer -= dt
         if self._spawn_timer <= 0:
-            if not self.alive():
-                self._spawn(snake, bodies)
+            if not self.alive() and self._spawn(snake):
                 self.add(self_group)
-                game_display.blit(background, self.rect)
-                pygame.display.update(self_group.draw(game_display))
             self._spawn_timer = 5
-        self._old_rect = self.rect
 
 
 class ScoreText(pygame.sprite.Sprite):
@@ -478,18 +487,23 @@ class ScoreText(pygame.sprite.Sprite):
         self.score = 0
         self.old_score = self.score
 
-        self.font = pygame.font.Font(None, 36)
+        self.font = game_init.load_font(36)
 
-        self.text = self.font.render("Score: {0}".format(self.score), 1,
-                                     (255, 255, 255), (0, 0, 0)).convert()
-        self.text.set_colorkey((0, 0, 0))
-        self.textpos = self.text.get_rect(
-            bottomleft=area.get_rect().bottomleft)
-        area.blit(background, self.textpos)
+        # "Score: " and each digit are only rendered once. The
+        # text of each score is put together from them.
+        self._prefix, self._digits = _score_glyphs(self.font)
+
+        # The text is drawn into this buffer, which is only replaced
+        # if the score outgrows it. Made to fit a 6 digit score.
+        self._text_buf = self._new_text_buf(
+            self._prefix.get_width()
+            + 6 * max(digit.get_width() for digit in self._digits))
+
+        self.update_text(area)
+        area.blit(background, self.textpos, self.textpos)
         area.blit(self.text, self.textpos)
-        pygame.display.update(self.textpos)
 
-    def update(self, area, background, added=0):
+    def update(self, area, background, dirty_rects, added=0):
         """Override the update method of Pygame's Sprite class.
 
         This is intended to be called for every 3 seconds of
@@ -509,6 +523,9 @@ class ScoreText(pygame.sprite.Sprite):
         background - the surface that the ScoreText object uses
                      to blit and update more efficiently on
                      the display surface.
+        dirty_rects - the list of this frame's changed areas of the
+                      display. ScoreText appends the area of its
+                      text to it, instead of updating the display.
 
         Optional argument:
         added - the amount of points to be added
@@ -517,9 +534,9 @@ class ScoreText(pygame.sprite.Sprite):
         self.score += added
         if self.score != self.old_score:
             self.update_text(area)
-            area.blit(background, self.textpos)
+            area.blit(background, self.textpos, self.textpos)
             area.blit(self.text, self.textpos)
-            pygame.display.update(self.textpos)
+            dirty_rects.append(self.textpos)
             self.old_score = self.score
 
     def update_text(self, area):
@@ -537,8 +554,37 @@ class ScoreText(pygame.sprite.Sprite):
                of the screen to blit and
                update itself to.
         """
-        self.text = self.font.render("Score: {0}".format(self.score), 1,
-                                     (255, 255, 255), (0, 0, 0)).convert()
-        self.text.set_colorkey((0, 0, 0))
+        glyphs = [self._prefix]
+        glyphs.extend(self._digits[int(digit)] for digit in str(self.score))
+
+        blit_list = []
+        width = 0
+        for glyph in glyphs:
+            blit_list.append((glyph, (width, 0)))
+            width += glyph.get_width()
+
+        if width > self._text_buf.get_width():
+            self._text_buf = self._new_text_buf(width)
+        else:
+            self._text_buf.fill((0, 0, 0))
+        self._text_buf.blits(blit_list, 0)
+
+        self.text = self._text_buf.subsurface(
+            (0, 0, width, self._text_buf.get_height()))
         self.textpos = self.text.get_rect(
             bottomleft=area.get_rect().bottomleft)
+
+    def _new_text_buf(self, width):
+        """Return a blank, colorkeyed surface to draw the text into.
+
+        Keyword arguments:
+        self - the ScoreText object itself
+        width - the width of the surface.
+
+        Return:
+        Pygame surface object
+        """
+        text_buf = pygame.Surface((width, self._prefix.get_height()))
+        text_buf = text_buf.convert()
+        text_buf.set_colorkey((0, 0, 0))
+        return text_buf